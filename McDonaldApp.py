@@ -1,21 +1,30 @@
 import threading
 import time
 import sys
+import os
+import selectors
+import heapq
 from collections import deque
 from tabulate import tabulate
-from datetime import datetime
 
 class Order:
+    __slots__ = (
+        'order_number', 'type', 'priority', 'status',
+        'creation_ts', 'start_ts', 'start_time_str', 'end_time_str',
+    )
+
     def __init__(self, order_number, order_type):
         self.order_number = order_number
-        self.type = order_type  # 'normal' or 'VIP'
+        self.type = order_type.upper()  # 'NORMAL' or 'VIP'
+        self.priority = 0 if self.type == 'VIP' else 1  # Lower is served first
         self.status = "PENDING"
-        self.creation_time = datetime.now()  # Track order creation time
-        self.start_time = None  # To track processing start time
-        self.end_time = None    # To track processing end time
+        self.creation_ts = time.monotonic()  # Monotonic creation time, for waiting time
+        self.start_ts = None  # Monotonic processing start, for waiting time and progress
+        self.start_time_str = None  # Formatted processing start time, for display
+        self.end_time_str = None    # Formatted processing end time, for display
 
     def __str__(self):
-        return f"Order {self.order_number} [{self.type.upper()}] - {self.status}"
+        return f"Order {self.order_number} [{self.type}] - {self.status}"
 
 class Bot(threading.Thread):
     def __init__(self, bot_id, controller):
@@ -30,36 +39,43 @@ class Bot(threading.Thread):
             order = self.controller.get_next_order()
             if order:
                 self.current_order = order
-                order.status = "PROCESSING"
-                order.start_time = datetime.now()  # Record processing start time
+                order.start_ts = time.monotonic()  # Record processing start time
+                order.start_time_str = format_time(time.time())  # Formatted once, shown on every render
+                self.controller.move_status(order, "PROCESSING")
                 print(f"\n[Bot {self.bot_id}] Started processing {order}")
-                start_time = time.time()
-                while time.time() - start_time < 10:
-                    if self.stop_event.is_set():
-                        print(f"\n[Bot {self.bot_id}] Stopping. Returning {order} to PENDING.")
-                        order.status = "PENDING"
-                        order.start_time = None
-                        self.current_order = None
-                        return
-                    time.sleep(1)  # Check every second if stop is requested
-                order.status = "COMPLETE"
-                order.end_time = datetime.now()  # Set end time on completion
+                # Wait out the processing time, waking up early only if stop is requested
+                if self.stop_event.wait(timeout=10):
+                    print(f"\n[Bot {self.bot_id}] Stopping. Returning {order} to PENDING.")
+                    self.controller.return_order(order)
+                    self.current_order = None
+                    return
+                order.end_time_str = format_time(time.time())  # Set end time on completion
+                self.controller.move_status(order, "COMPLETE")
                 print(f"\n[Bot {self.bot_id}] Completed {order}")
                 self.current_order = None
             else:
-                time.sleep(1)  # Wait before checking again if no orders are pending
+                self.controller.wait_for_order(self.stop_event)  # Stay idle until an order comes in
 
-    def stop(self):
+    def request_stop(self):
+        # Signal the bot to stop without waiting for it to finish
         self.stop_event.set()
+        self.controller.wake_bots()  # Wake the bot up if it is idle
         if self.current_order:
             print(f"\n[Bot {self.bot_id}] is being stopped while processing {self.current_order}")
+
+    def stop(self):
+        self.request_stop()
         self.join()
 
+MAX_COMPLETED_ORDERS = 1000  # Completed orders kept for viewing, oldest are dropped first
+
 class OrderController:
     def __init__(self):
         self.order_lock = threading.Lock()
-        self.orders = []  # List of all orders
-        self.pending_orders = deque()  # Queue for pending orders
+        self.pending_orders = []  # Heap of (priority, order number, order) for pending orders
+        self.order_available = threading.Condition()  # Guards pending_orders and by_status, notified whenever an order is queued
+        # Orders indexed by status. Completed orders go to a bounded deque, so history stops growing once it is full
+        self.by_status = {"PENDING": set(), "PROCESSING": set(), "COMPLETE": deque(maxlen=MAX_COMPLETED_ORDERS)}
         self.order_number = 0
         self.bots = []
         self.bot_id_counter = 1
@@ -68,29 +84,46 @@ class OrderController:
         with self.order_lock:
             self.order_number += 1
             new_order = Order(self.order_number, order_type)
-            self.orders.append(new_order)
-            
-            if order_type.upper() == 'VIP':
-                # Find the position after the last VIP order in the pending queue
-                index = 0
-                for i, order in enumerate(self.pending_orders):
-                    if order.type.upper() != 'VIP':  # Stop when you reach the first non-VIP order
-                        break
-                    index = i + 1
-                self.pending_orders.insert(index, new_order)  # Insert VIP order at the found position
-            else:
-                # Normal orders always go to the end of the queue
-                self.pending_orders.append(new_order)
-            
             print(f"\n[System] Added {new_order}")
+        self._enqueue(new_order)
+
+    def _enqueue(self, order):
+        # VIP orders sort ahead of normal ones, and the order number keeps them FIFO within each type
+        with self.order_available:
+            self.move_status(order, "PENDING")
+            heapq.heappush(self.pending_orders, (order.priority, order.order_number, order))
+            self.order_available.notify()
 
     def get_next_order(self):
-        with self.order_lock:
+        with self.order_available:
             if self.pending_orders:
-                order = self.pending_orders.popleft()
-                return order
+                return heapq.heappop(self.pending_orders)[2]
+            return None
+
+    def return_order(self, order):
+        # An interrupted order is re-queued with its original key, so it gets its old place back
+        with self.order_available:
+            order.start_ts = None
+            order.start_time_str = None
+            self._enqueue(order)
+
+    def move_status(self, order, new_status):
+        # Keep by_status in step with order.status so filtered views never scan every order
+        with self.order_available:
+            self.by_status[order.status].discard(order)  # Orders never leave COMPLETE, so this is always a set
+            order.status = new_status
+            if new_status == "COMPLETE":
+                self.by_status[new_status].append(order)
             else:
-                return None
+                self.by_status[new_status].add(order)
+
+    def wait_for_order(self, stop_event):
+        with self.order_available:
+            self.order_available.wait_for(lambda: stop_event.is_set() or self.pending_orders)
+
+    def wake_bots(self):
+        with self.order_available:
+            self.order_available.notify_all()
 
     def add_bot(self):
         with self.order_lock:
@@ -103,113 +136,184 @@ class OrderController:
 
     def remove_bot(self):
         with self.order_lock:
-            if not self.bots:
-                print("\n[System] No bots to remove.")
-                return
-            bot = self.bots.pop()
-            bot.stop()
-            print(f"\n[System] Removed Bot {bot.bot_id}")
+            bot = self.bots.pop() if self.bots else None
+        if not bot:
+            print("\n[System] No bots to remove.")
+            return
+        # Stop the bot outside order_lock, since it waits for the bot thread to exit
+        bot.stop()
+        print(f"\n[System] Removed Bot {bot.bot_id}")
 
     def view_orders(self):
+        last_view = None
+        live = False  # Whether the table on screen still has orders that change as time passes
+
+        def refresh():
+            # Redraw a live view in place while its orders change, plus one last frame once they are gone
+            nonlocal live
+            if last_view not in LIVE_VIEWS or not (live or self.by_status[last_view]):
+                return False
+            live = bool(self.by_status[last_view])
+            print(CLEAR_SCREEN, end="")
+            self.display_orders(last_view)
+            print_view_menu()
+            return True
+
         while True:
-            print("\n--- View Orders ---")
-            print("1. All Orders")
-            print("2. PENDING Orders")
-            print("3. PROCESSING Orders")
-            print("4. COMPLETE Orders")
-            print("5. Back to Main Menu")
-            choice = input("Select an option to view orders: ").strip()
+            print_view_menu()
+            choice = read_choice("Select an option to view orders: ", on_idle=refresh)
 
             if choice == '1':
-                self.display_orders("ALL")
+                last_view = "ALL"
             elif choice == '2':
-                self.display_orders("PENDING")
+                last_view = "PENDING"
             elif choice == '3':
-                self.display_orders("PROCESSING")
+                last_view = "PROCESSING"
             elif choice == '4':
-                self.display_orders("COMPLETE")
+                last_view = "COMPLETE"
             elif choice == '5':
                 break
             else:
                 print("Invalid choice. Please select a valid option.")
+                continue
+            live = last_view in LIVE_VIEWS and bool(self.by_status[last_view])
+            self.display_orders(last_view)
 
     def display_orders(self, filter_status):
-        with self.order_lock:
-            if not self.orders:
-                print("\n[System] No orders have been placed yet.")
-                return
-
-            filtered_orders = []
-            for order in self.orders:
-                if filter_status == "ALL" or order.status == filter_status:
-                    if order.status == "PENDING":
-                        waiting_time = (datetime.now() - order.creation_time).total_seconds()
-                        waiting_time_str = f"{int(waiting_time)}s"
-                        start_time_str = "-"
-                        end_time_str = "-"
-                    elif order.status == "PROCESSING":
-                        waiting_time = (order.start_time - order.creation_time).total_seconds()
-                        waiting_time_str = f"{int(waiting_time)}s"
-                        start_time_str = order.start_time.strftime('%Y-%m-%d %H:%M:%S') if order.start_time else "-"
-                        end_time_str = "-"
-                    elif order.status == "COMPLETE":
-                        waiting_time = (order.start_time - order.creation_time).total_seconds() if order.start_time else 0
-                        waiting_time_str = f"{int(waiting_time)}s"
-                        start_time_str = order.start_time.strftime('%Y-%m-%d %H:%M:%S') if order.start_time else "-"
-                        end_time_str = order.end_time.strftime('%Y-%m-%d %H:%M:%S') if order.end_time else "-"
-                    else:
-                        waiting_time_str = "-"
-                        start_time_str = "-"
-                        end_time_str = "-"
-                    
-                    if order.status == "PROCESSING" and order.start_time:
-                        elapsed = (datetime.now() - order.start_time).total_seconds()
-                        progress = min(elapsed / 10, 1)  # Ensure it doesn't exceed 100%
-                        progress_bar = generate_progress_bar(progress)
-                        percentage = int(progress * 100)
-                        filtered_orders.append([
-                            order.order_number,
-                            order.type.upper(),
-                            order.status,
-                            f"{progress_bar} {percentage}%",
-                            start_time_str,
-                            end_time_str,
-                            waiting_time_str
-                        ])
-                    else:
-                        filtered_orders.append([
-                            order.order_number,
-                            order.type.upper(),
-                            order.status,
-                            "-",
-                            start_time_str,
-                            end_time_str,
-                            waiting_time_str
-                        ])
-
-            if not filtered_orders:
-                print(f"\n[System] No orders found with status '{filter_status}'.")
-                return
-
-            headers = ["Order #", "Type", "Status", "Progress", "Start Time", "End Time", "Waiting Time"]
-            print("\n" + tabulate(filtered_orders, headers=headers, tablefmt="grid"))
+        if not self.order_number:
+            print("\n[System] No orders have been placed yet.")
+            return
+
+        # Copy out the fields we need while holding the lock, then format without it
+        with self.order_available:
+            if filter_status == "ALL":
+                orders = [o for status_orders in self.by_status.values() for o in status_orders]
+            else:
+                orders = self.by_status[filter_status]
+            snapshot = [
+                (o.order_number, o.type, o.status, o.creation_ts, o.start_ts, o.start_time_str, o.end_time_str)
+                for o in orders
+            ]
+        snapshot.sort()  # Order numbers are unique, so this sorts by order number
+
+        now = time.monotonic()  # One timestamp for the whole table
+        filtered_orders = []
+        for order_number, order_type, status, creation_ts, start_ts, started_at, ended_at in snapshot:
+            if status == "PENDING":
+                waiting_time = now - creation_ts
+                waiting_time_str = f"{int(waiting_time)}s"
+                start_time_str = "-"
+                end_time_str = "-"
+            elif status == "PROCESSING":
+                waiting_time = start_ts - creation_ts
+                waiting_time_str = f"{int(waiting_time)}s"
+                start_time_str = started_at or "-"
+                end_time_str = "-"
+            elif status == "COMPLETE":
+                waiting_time = start_ts - creation_ts if start_ts is not None else 0
+                waiting_time_str = f"{int(waiting_time)}s"
+                start_time_str = started_at or "-"
+                end_time_str = ended_at or "-"
+            else:
+                waiting_time_str = "-"
+                start_time_str = "-"
+                end_time_str = "-"
+            
+            if status == "PROCESSING" and start_ts is not None:
+                elapsed = now - start_ts
+                progress = min(elapsed / 10, 1)  # Ensure it doesn't exceed 100%
+                progress_bar = generate_progress_bar(progress)
+                percentage = int(progress * 100)
+                filtered_orders.append([
+                    order_number,
+                    order_type,
+                    status,
+                    f"{progress_bar} {percentage}%",
+                    start_time_str,
+                    end_time_str,
+                    waiting_time_str
+                ])
+            else:
+                filtered_orders.append([
+                    order_number,
+                    order_type,
+                    status,
+                    "-",
+                    start_time_str,
+                    end_time_str,
+                    waiting_time_str
+                ])
+
+        if not filtered_orders:
+            print(f"\n[System] No orders found with status '{filter_status}'.")
+            return
+
+        headers = ["Order #", "Type", "Status", "Progress", "Start Time", "End Time", "Waiting Time"]
+        print("\n" + tabulate(filtered_orders, headers=headers, tablefmt="grid"))
 
     def shutdown(self):
         print("\n[System] Shutting down all bots...")
+        # Signal every bot first so they all wind down together, then wait for them
         for bot in self.bots:
-            bot.stop()
+            bot.request_stop()
+        for bot in self.bots:
+            bot.join()
         print("[System] All bots have been shut down.")
 
-def generate_progress_bar(progress, length=20):
+def format_time(timestamp):
+    """
+    Formats a wall-clock timestamp for display.
+    :param timestamp: Seconds since the epoch, as returned by time.time().
+    :return: The local time as 'YYYY-MM-DD HH:MM:SS'.
+    """
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
+
+PROGRESS_BAR_LENGTH = 20
+# Every bar that can be drawn, indexed by the number of filled cells
+_PROGRESS_BARS = [
+    f"[{'#' * filled}{'-' * (PROGRESS_BAR_LENGTH - filled)}]"
+    for filled in range(PROGRESS_BAR_LENGTH + 1)
+]
+
+def generate_progress_bar(progress):
     """
     Generates a simple text-based progress bar using ASCII characters.
     :param progress: Float between 0 and 1 indicating progress.
-    :param length: The length of the progress bar.
-    :return: A string representing the progress bar.
+    :return: A string representing the progress bar, looked up from the prebuilt bars.
     """
-    filled_length = int(length * progress)
-    bar = '#' * filled_length + '-' * (length - filled_length)
-    return f"[{bar}]"
+    return _PROGRESS_BARS[int(PROGRESS_BAR_LENGTH * progress)]
+
+REFRESH_INTERVAL = 1  # Seconds between redraws while waiting for input
+LIVE_VIEWS = ("PENDING", "PROCESSING")  # Views whose waiting times or progress bars change on their own
+CLEAR_SCREEN = "\033[H\033[J"  # ANSI: move the cursor home and clear the screen
+
+def read_choice(prompt, on_idle=None):
+    """
+    Reads a menu choice from stdin without freezing the screen while the user is idle.
+    :param prompt: The prompt to show.
+    :param on_idle: Optional callable run every REFRESH_INTERVAL seconds until a line is entered.
+                    It returns True if it printed anything, so the prompt is shown again.
+    :return: The entered line, stripped of surrounding whitespace.
+    """
+    # selectors can only watch stdin on POSIX terminals, so fall back to a plain input() elsewhere
+    if on_idle is None or os.name != 'posix' or not sys.stdin.isatty():
+        return input(prompt).strip()
+
+    print(prompt, end="", flush=True)
+    with selectors.DefaultSelector() as selector:
+        selector.register(sys.stdin, selectors.EVENT_READ)
+        while not selector.select(timeout=REFRESH_INTERVAL):
+            if on_idle():
+                print(prompt, end="", flush=True)
+    return input().strip()
+
+def print_view_menu():
+    print("\n--- View Orders ---")
+    print("1. All Orders")
+    print("2. PENDING Orders")
+    print("3. PROCESSING Orders")
+    print("4. COMPLETE Orders")
+    print("5. Back to Main Menu")
 
 def print_menu():
     print("\n--- McOrder CLI ---")